@@ -1,8 +1,31 @@
-from . import _version
 from .client import CensusClient  # noqa
 from .credentials import CensusCredentials  # noqa
 from .runs import get_census_sync_run_info  # noqa
-from .syncs import CensusSync, trigger_census_sync  # noqa
+from .syncs import CensusSync, trigger_census_sync, trigger_census_syncs  # noqa
 from .flows import run_census_sync  # noqa
+from ._runtime import install_uvloop
 
-__version__ = _version.get_versions()["version"]
+install_uvloop()
+
+__all__ = [
+    "CensusClient",
+    "CensusCredentials",
+    "CensusSync",
+    "get_census_sync_run_info",
+    "run_census_sync",
+    "trigger_census_sync",
+    "trigger_census_syncs",
+]
+
+
+def __getattr__(name: str):
+    """
+    Resolves `__version__` on first access, since computing it from a source
+    checkout shells out to git.
+    """
+    if name == "__version__":
+        from . import _version
+
+        version = globals()["__version__"] = _version.get_versions()["version"]
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,31 @@
+"""Opt-in event loop configuration applied when prefect_census is imported."""
+import asyncio
+import os
+import sys
+
+
+def install_uvloop() -> bool:
+    """
+    Installs uvloop as the asyncio event loop policy if the `CENSUS_USE_UVLOOP`
+    environment variable is set to a truthy value. Event loops created afterwards,
+    e.g. by `asyncio.run`, are uvloop loops; a loop that is already running is
+    left as is.
+
+    Nothing happens on Windows, where uvloop is unsupported, or when uvloop is
+    not installed; install it with `pip install "prefect-census[uvloop]"`.
+
+    Returns:
+        Whether uvloop was installed.
+    """
+    if os.environ.get("CENSUS_USE_UVLOOP", "").lower() not in ("1", "true", "yes"):
+        return False
+    if sys.platform == "win32":
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
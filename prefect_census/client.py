@@ -2,7 +2,7 @@
 from typing import Any, Dict, Optional
 
 import prefect
-from httpx import AsyncClient, Response
+from httpx import AsyncClient, AsyncHTTPTransport, Limits, Response
 from prefect.utilities.asyncutils import sync_compatible
 
 
@@ -12,18 +12,36 @@ class CensusClient:
 
     Attributes:
         api_key (str): API key to authenticate with the Census API.
+        auth_header (str): Preformatted `Authorization` header value
+            (e.g. `Bearer my_api_key`). Takes precedence over `api_key`.
     """
 
-    def __init__(self, api_key: str):
-        self._closed = False
-        self._started = False
+    __slots__ = ("client",)
+
+    _RUN_INFO_PATH = "/sync_runs/%s"
+    _TRIGGER_SYNC_RUN_PATH = "/syncs/%s/trigger"
+
+    def __init__(
+        self, api_key: Optional[str] = None, auth_header: Optional[str] = None
+    ):
+        if auth_header is None:
+            if api_key is None:
+                raise ValueError("Either `api_key` or `auth_header` must be provided.")
+            auth_header = f"Bearer {api_key}"
 
         self.client = AsyncClient(
             base_url="https://app.getcensus.com/api/v1",
             headers={
-                "Authorization": f"Bearer {api_key}",
+                "Authorization": auth_header,
                 "user-agent": f"prefect-{prefect.__version__}",
             },
+            transport=AsyncHTTPTransport(
+                http2=True,
+                # Idle connections are kept for longer than the backed off wait
+                # between status checks, so polls keep reusing them
+                limits=Limits(max_keepalive_connections=20, keepalive_expiry=60),
+                retries=2,
+            ),
         )
 
     @sync_compatible
@@ -73,7 +91,8 @@ class CensusClient:
         response = await self.client.request(
             method=http_method, url=path, params=params, json=json
         )
-        response.raise_for_status()
+        if not 200 <= response.status_code < 300:
+            response.raise_for_status()
         return response
 
     @sync_compatible
@@ -87,10 +106,10 @@ class CensusClient:
         Returns:
             The response from the Census API.
         """  # noqa
-        return await self.call_endpoint(
-            http_method="GET",
-            path=f"/sync_runs/{run_id}",
-        )
+        response = await self.client.get(self._RUN_INFO_PATH % run_id)
+        if not 200 <= response.status_code < 300:
+            response.raise_for_status()
+        return response
 
     @sync_compatible
     async def trigger_sync_run(
@@ -107,25 +126,22 @@ class CensusClient:
         Returns:
             The response from the Census API.
         """  # noqa
-        return await self.call_endpoint(
-            http_method="POST",
-            path=f"/syncs/{sync_id}/trigger",
+        response = await self.client.post(
+            self._TRIGGER_SYNC_RUN_PATH % sync_id,
             params={"force_full_sync": force_full_sync},
         )
+        if not 200 <= response.status_code < 300:
+            response.raise_for_status()
+        return response
 
     async def __aenter__(self):
         """Async context manager entry method."""
-        if self._closed:
+        if self.client.is_closed:
             raise RuntimeError(
                 "The client cannot be started again after it has been closed."
             )
-        if self._started:
-            raise RuntimeError("The client cannot be started more than once.")
-
-        self._started = True
         return self
 
     async def __aexit__(self, *exc):
         """Async context manager exit method."""
-        self._closed = True
-        await self.client.__aexit__()
+        await self.client.__aexit__(*exc)
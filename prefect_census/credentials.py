@@ -1,15 +1,40 @@
 """Module containing credentials for interacting with Census."""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+
 from prefect.blocks.abstract import CredentialsBlock
 from pydantic import VERSION as PYDANTIC_VERSION
 
 if PYDANTIC_VERSION.startswith("2."):
-    from pydantic.v1 import Field, SecretStr
+    from pydantic.v1 import Field, PrivateAttr, SecretStr
 else:
-    from pydantic import Field, SecretStr
+    from pydantic import Field, PrivateAttr, SecretStr
 
 from prefect_census.client import CensusClient
 
 
+class _SharedClient:
+    """A client shared through `CensusCredentials.shared_client` and its users."""
+
+    __slots__ = ("client", "users")
+
+    def __init__(self, client: CensusClient):
+        self.client = client
+        self.users = 0
+
+
+# Clients shared through `CensusCredentials.shared_client`, keyed by event loop and
+# then by `Authorization` header. An httpx connection pool is bound to the loop it
+# was created on, so a client is only shared within a single loop. An entry only
+# exists while a `shared_client` context uses it; the last one to exit closes the
+# client.
+_shared_clients: "WeakKeyDictionary[Any, Dict[str, _SharedClient]]" = (
+    WeakKeyDictionary()
+)
+
+
 class CensusCredentials(CredentialsBlock):
     """
     Credentials block for credential use across Census tasks and flows.
@@ -68,6 +93,21 @@ class CensusCredentials(CredentialsBlock):
         ..., title="API Key", description="API key to authenticate with the Census API."
     )
 
+    # The API key the header was derived from and the derived header
+    _auth_header: Optional[Tuple[SecretStr, str]] = PrivateAttr(default=None)
+
+    def _get_auth_header(self) -> str:
+        """
+        Returns the `Authorization` header value for the current API key,
+        deriving it only when the API key has changed.
+        """
+        if self._auth_header is None or self._auth_header[0] is not self.api_key:
+            self._auth_header = (
+                self.api_key,
+                f"Bearer {self.api_key.get_secret_value()}",
+            )
+        return self._auth_header[1]
+
     def get_client(self) -> CensusClient:
         """
         Provides an authenticated client for working with the Census API.
@@ -75,4 +115,48 @@ class CensusCredentials(CredentialsBlock):
         Returns:
             A authenticated Census API client
         """
-        return CensusClient(api_key=self.api_key.get_secret_value())
+        return CensusClient(auth_header=self._get_auth_header())
+
+    @asynccontextmanager
+    async def shared_client(self) -> AsyncIterator[CensusClient]:
+        """
+        Provides an authenticated client that is shared with every other open
+        `shared_client` context using the same API key on the running event loop,
+        so that connections are kept alive and reused between requests. The
+        client is closed once the last of these contexts exits.
+
+        Unlike the client returned by `get_client`, the shared client must not be
+        closed by the caller or used after the context exits.
+
+        Yields:
+            A authenticated Census API client
+
+        Example:
+            ```python
+            from prefect import flow
+            from prefect_census import CensusCredentials
+
+            @flow
+            async def trigger_sync_run_flow():
+                credentials = CensusCredentials.load("my-census-credentials")
+                async with credentials.shared_client() as client:
+                    await client.trigger_sync_run(sync_id=42)
+            ```
+        """
+        auth_header = self._get_auth_header()
+        loop_clients = _shared_clients.setdefault(asyncio.get_running_loop(), {})
+        shared = loop_clients.get(auth_header)
+        if shared is None or shared.client.client.is_closed:
+            shared = loop_clients[auth_header] = _SharedClient(
+                CensusClient(auth_header=auth_header)
+            )
+
+        shared.users += 1
+        try:
+            yield shared.client
+        finally:
+            shared.users -= 1
+            if shared.users == 0:
+                if loop_clients.get(auth_header) is shared:
+                    del loop_clients[auth_header]
+                await shared.client.client.aclose()
@@ -1,14 +1,28 @@
 """Module containing tasks and flows for interacting with Census sync runs"""
 import asyncio
+import random
+import time
 from enum import Enum
-from typing import Any, Dict, Tuple
+from logging import Logger
+from typing import Any, Dict, Optional, Set, Tuple
+from weakref import WeakValueDictionary
 
+import orjson
 from httpx import HTTPStatusError
 from prefect import flow, task
 from prefect.logging import get_run_logger
 
+from prefect_census.client import CensusClient
 from prefect_census.credentials import CensusCredentials
-from prefect_census.utils import extract_user_message
+from prefect_census.utils import (
+    extract_user_message,
+    is_transient_error,
+    retry_unless_client_error,
+)
+
+# Fraction of random extra wait added to each backed off status check, so that
+# concurrent waiters on the same Census tenant do not poll in lockstep
+_POLL_JITTER = 0.1
 
 
 class CensusSyncRunFailed(RuntimeError):
@@ -46,12 +60,40 @@ class CensusSyncRunStatus(Enum):
         Returns True if a status code is terminal for a sync run.
         Returns False otherwise.
         """
-        return status_code in [
-            cls.CANCELLED.value,
-            cls.FAILED.value,
-            cls.COMPLETED.value,
-            cls.SKIPPED.value,
-        ]
+        return status_code in _TERMINAL_STATUS_CODES
+
+
+_TERMINAL_STATUS_CODES = frozenset(
+    status.value
+    for status in (
+        CensusSyncRunStatus.CANCELLED,
+        CensusSyncRunStatus.FAILED,
+        CensusSyncRunStatus.COMPLETED,
+        CensusSyncRunStatus.SKIPPED,
+    )
+)
+
+
+async def _get_run_info_raw(client: CensusClient, run_id: int) -> Dict[str, Any]:
+    """
+    Retrieves the data of a Census sync run using an already opened client.
+
+    Args:
+        client: The Census client to send the request with.
+        run_id: The ID of the sync run to get details for.
+
+    Raises:
+        CensusGetSyncRunInfoFailed: If the Census API responds with an error.
+
+    Returns:
+        The run data returned by the Census API.
+    """
+    try:
+        response = await client.get_run_info(run_id)
+    except HTTPStatusError as e:
+        raise CensusGetSyncRunInfoFailed(extract_user_message(e)) from e
+
+    return orjson.loads(response.content)["data"]
 
 
 @task(
@@ -60,10 +102,14 @@ class CensusSyncRunStatus(Enum):
         "Retrieves details of a Census sync run" "for the sync with the given sync_id."
     ),
     retries=3,
-    retry_delay_seconds=10,
+    retry_delay_seconds=[2, 5, 15],
+    retry_jitter_factor=0.5,
+    retry_condition_fn=retry_unless_client_error,
 )
 async def get_census_sync_run_info(
-    credentials: CensusCredentials, run_id: int
+    credentials: CensusCredentials,
+    run_id: int,
+    client: Optional[CensusClient] = None,
 ) -> Dict[str, Any]:
     """
     A task to retrieve information a Census sync run.
@@ -71,6 +117,9 @@ async def get_census_sync_run_info(
     Args:
         credentials: Credentials for authenticating with Census.
         run_id: The ID of the run of the sync to trigger.
+        client: An already opened Census client to send the request with. If not
+            provided, the client shared by `credentials` on the running event loop
+            is used.
 
     Returns:
         The run data returned by the Census API as dict with the following shape:
@@ -121,13 +170,267 @@ async def get_census_sync_run_info(
         get_sync_run_info_flow()
         ```
     """  # noqa
-    try:
-        async with credentials.get_client() as client:
-            response = await client.get_run_info(run_id)
-    except HTTPStatusError as e:
-        raise CensusGetSyncRunInfoFailed(extract_user_message(e)) from e
+    if client is None:
+        async with credentials.shared_client() as client:
+            return await _get_run_info_raw(client, run_id)
+
+    return await _get_run_info_raw(client, run_id)
+
+
+def _check_poll_seconds(
+    poll_frequency_seconds: float, initial_poll_seconds: float
+) -> None:
+    """
+    Rejects poll intervals that are not positive, since a wait of zero seconds
+    never backs off and would check the run status in a busy loop.
+    """
+    if poll_frequency_seconds <= 0 or initial_poll_seconds <= 0:
+        raise ValueError(
+            "poll_frequency_seconds and initial_poll_seconds must be positive, got "
+            f"{poll_frequency_seconds} and {initial_poll_seconds}."
+        )
+
+
+class _PolledRun:
+    """The polling state of a single `CensusPollCoordinator.wait_for_terminal` call."""
+
+    def __init__(
+        self,
+        run_id: int,
+        deadline: float,
+        poll_frequency_seconds: float,
+        initial_poll_seconds: float,
+        logger: Optional[Logger],
+    ):
+        self.run_id = run_id
+        self.deadline = deadline
+        self.poll_delay = min(initial_poll_seconds, poll_frequency_seconds)
+        self.max_poll_delay = poll_frequency_seconds
+        self.next_poll_at = time.monotonic()
+        self.logger = logger
+        self.future = asyncio.get_running_loop().create_future()
+
+
+class CensusPollCoordinator:
+    """
+    Waits for many Census sync runs at once over a single client.
 
-    return response.json()["data"]
+    A single polling coroutine checks every run that is due in one concurrent
+    batch, so N waiters cost one wake-up and N multiplexed requests per round
+    instead of N independent polling loops. Each run backs off on its own: the
+    wait after a non-terminal status starts at its `initial_poll_seconds` and
+    doubles after every check, up to its `poll_frequency_seconds`, with up to
+    10% of random jitter added to every wait. A status check failing with a
+    server error, rate limiting or a transport error is retried with the same
+    backoff until the deadline; only client errors fail the wait right away.
+
+    Use `CensusPollCoordinator.for_client` to share a coordinator between all
+    callers waiting through the same client.
+
+    Example:
+        Wait for several sync runs concurrently:
+        ```python
+        import asyncio
+        import time
+
+        from prefect import flow
+
+        from prefect_census import CensusCredentials
+        from prefect_census.runs import CensusPollCoordinator
+
+        @flow
+        async def wait_for_sync_runs_flow(run_ids):
+            credentials = CensusCredentials.load("my-census-credentials")
+            async with credentials.shared_client() as client:
+                coordinator = CensusPollCoordinator.for_client(client)
+
+                deadline = time.monotonic() + 900
+                return await asyncio.gather(
+                    *(
+                        coordinator.wait_for_terminal(run_id, deadline)
+                        for run_id in run_ids
+                    )
+                )
+        ```
+    """
+
+    def __init__(self, client: CensusClient):
+        self.client = client
+        self._pending: Set[_PolledRun] = set()
+        self._poller: Optional[asyncio.Future] = None
+        self._wakeup = asyncio.Event()
+
+    @classmethod
+    def for_client(cls, client: CensusClient) -> "CensusPollCoordinator":
+        """
+        Returns the coordinator shared by everyone currently waiting through
+        `client`, creating one if there is none.
+
+        Args:
+            client: The Census client to poll sync runs with.
+
+        Returns:
+            A coordinator polling with `client`.
+        """
+        coordinator = _poll_coordinators.get(id(client))
+        if coordinator is None:
+            coordinator = _poll_coordinators[id(client)] = cls(client)
+        return coordinator
+
+    async def wait_for_terminal(
+        self,
+        run_id: int,
+        deadline: float,
+        poll_frequency_seconds: float = 5,
+        initial_poll_seconds: float = 1.0,
+        logger: Optional[Logger] = None,
+    ) -> Dict[str, Any]:
+        """
+        Wait for the given Census sync run to reach a terminal status.
+
+        Args:
+            run_id: The ID of the sync run to wait for.
+            deadline: The `time.monotonic()` time by which the run must have
+                reached a terminal status. The last check happens at the deadline.
+            poll_frequency_seconds: Maximum number of seconds to wait in between
+                checks for run completion.
+            initial_poll_seconds: Number of seconds to wait after the first check
+                for run completion. The wait doubles after every subsequent check,
+                up to `poll_frequency_seconds`.
+            logger: Logger to report non-terminal statuses to.
+
+        Raises:
+            ValueError: When a poll interval is not positive.
+            CensusSyncRunTimeout: When the run is still not terminal at `deadline`.
+            CensusGetSyncRunInfoFailed: When Census rejects the status check with a
+                client error, or when the last check before `deadline` failed.
+
+        Returns:
+            The run data returned by the Census API for the terminal status.
+        """
+        _check_poll_seconds(poll_frequency_seconds, initial_poll_seconds)
+        run = _PolledRun(
+            run_id, deadline, poll_frequency_seconds, initial_poll_seconds, logger
+        )
+        self._pending.add(run)
+        self._wakeup.set()
+        if self._poller is None:
+            self._poller = asyncio.ensure_future(self._poll())
+
+        try:
+            return await run.future
+        finally:
+            self._pending.discard(run)
+
+    async def _poll(self) -> None:
+        """Checks all due runs in batches until no run is left to wait for."""
+        try:
+            while self._pending:
+                self._wakeup.clear()
+                now = time.monotonic()
+                due = [run for run in self._pending if run.next_poll_at <= now]
+                results = await asyncio.gather(
+                    *(_get_run_info_raw(self.client, run.run_id) for run in due),
+                    return_exceptions=True,
+                )
+                for run, result in zip(due, results):
+                    try:
+                        self._handle_result(run, result)
+                    except Exception as exc:
+                        # Only the run whose result could not be handled fails
+                        self._pending.discard(run)
+                        if not run.future.done():
+                            run.future.set_exception(exc)
+
+                if self._pending:
+                    next_poll_at = min(run.next_poll_at for run in self._pending)
+                    try:
+                        await asyncio.wait_for(
+                            self._wakeup.wait(), max(next_poll_at - time.monotonic(), 0)
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+        except Exception as exc:
+            for run in self._pending:
+                if not run.future.done():
+                    run.future.set_exception(exc)
+        finally:
+            self._poller = None
+
+    def _handle_result(self, run: _PolledRun, result: Any) -> None:
+        """Resolves or reschedules a run after one of its status checks."""
+        if run.future.done():
+            # The waiter went away while the check was in flight
+            self._pending.discard(run)
+            return
+
+        if isinstance(result, BaseException):
+            if is_transient_error(result):
+                delay = self._reschedule(run)
+                if delay is not None:
+                    if run.logger is not None:
+                        run.logger.warning(
+                            "Checking the status of Census sync run with ID %i "
+                            "failed with %r. Retrying in %.1f seconds.",
+                            run.run_id,
+                            result,
+                            delay,
+                        )
+                    return
+            run.future.set_exception(result)
+            self._pending.discard(run)
+            return
+
+        # Raises for a status unknown to this package, which fails only this run
+        status = CensusSyncRunStatus(result.get("status"))
+        if status.value in _TERMINAL_STATUS_CODES:
+            run.future.set_result(result)
+        else:
+            delay = self._reschedule(run)
+            if delay is not None:
+                if run.logger is not None:
+                    run.logger.info(
+                        "Census sync run with ID %i has status %s. "
+                        "Waiting for %.1f seconds.",
+                        run.run_id,
+                        status.name,
+                        delay,
+                    )
+                return
+
+            run.future.set_exception(
+                CensusSyncRunTimeout(
+                    f"Deadline exceeded while waiting for sync run with ID "
+                    f"{run.run_id} to complete."
+                )
+            )
+        self._pending.discard(run)
+
+    @staticmethod
+    def _reschedule(run: _PolledRun) -> Optional[float]:
+        """
+        Schedules the next status check of a run after the backed off delay,
+        returning the delay, or returns None if the run's deadline has passed.
+        """
+        seconds_remaining = run.deadline - time.monotonic()
+        if seconds_remaining <= 0:
+            return None
+
+        delay = min(
+            run.poll_delay * (1 + random.random() * _POLL_JITTER),
+            seconds_remaining,
+        )
+        run.next_poll_at = time.monotonic() + delay
+        run.poll_delay = min(run.poll_delay * 2, run.max_poll_delay)
+        return delay
+
+
+# Coordinators in use, keyed by the id of their client. A coordinator holds its
+# client, so the id stays unique for as long as the entry exists; entries go away
+# once no waiter references the coordinator anymore.
+_poll_coordinators: "WeakValueDictionary[int, CensusPollCoordinator]" = (
+    WeakValueDictionary()
+)
 
 
 @flow(
@@ -137,8 +440,9 @@ async def get_census_sync_run_info(
 async def wait_census_sync_completion(
     run_id: int,
     credentials: CensusCredentials,
-    max_wait_seconds: int = 60,
-    poll_frequency_seconds: int = 5,
+    max_wait_seconds: float = 60,
+    poll_frequency_seconds: float = 5,
+    initial_poll_seconds: float = 1.0,
 ) -> Tuple[CensusSyncRunStatus, Dict[str, Any]]:
     """
     Wait for the given Census sync run to finish running.
@@ -147,10 +451,14 @@ async def wait_census_sync_completion(
         run_id: The ID of the sync run to wait for.
         credentials: Credentials for authenticating with Census.
         max_wait_seconds: Maximum number of seconds to wait for sync to complete.
-        poll_frequency_seconds: Number of seconds to wait in between checks for
-            run completion.
+        poll_frequency_seconds: Maximum number of seconds to wait in between checks
+            for run completion.
+        initial_poll_seconds: Number of seconds to wait after the first check for
+            run completion. The wait doubles after every subsequent check, up to
+            `poll_frequency_seconds`.
 
     Raises:
+        ValueError: When a poll interval is not positive.
         CensusSyncRunTimeout: When the elapsed wait time exceeds `max_wait_seconds`.
 
     Returns:
@@ -185,31 +493,19 @@ async def wait_census_sync_completion(
 
     """
     logger = get_run_logger()
-    seconds_waited_for_run_completion = 0
-    wait_for = []
-    while seconds_waited_for_run_completion <= max_wait_seconds:
-        run_data_future = await get_census_sync_run_info.submit(
-            credentials=credentials,
-            run_id=run_id,
-            wait_for=wait_for,
-        )
-        run_data = await run_data_future.result()
-        run_status = run_data.get("status")
-
-        if CensusSyncRunStatus.is_terminal_status_code(run_status):
-            return CensusSyncRunStatus(run_status), run_data
-
-        wait_for = [run_data_future]
-        logger.info(
-            "Census sync run with ID %i has status %s. Waiting for %i seconds.",
-            run_id,
-            CensusSyncRunStatus(run_status).name,
-            poll_frequency_seconds,
-        )
-        await asyncio.sleep(poll_frequency_seconds)
-        seconds_waited_for_run_completion += poll_frequency_seconds
-
-    raise CensusSyncRunTimeout(
-        f"Max wait time of {max_wait_seconds} seconds exceeded while waiting "
-        f"for sync run with ID {run_id}"
-    )
+    async with credentials.shared_client() as client:
+        coordinator = CensusPollCoordinator.for_client(client)
+        try:
+            run_data = await coordinator.wait_for_terminal(
+                run_id,
+                deadline=time.monotonic() + max_wait_seconds,
+                poll_frequency_seconds=poll_frequency_seconds,
+                initial_poll_seconds=initial_poll_seconds,
+                logger=logger,
+            )
+        except CensusSyncRunTimeout:
+            raise CensusSyncRunTimeout(
+                f"Max wait time of {max_wait_seconds} seconds exceeded while waiting "
+                f"for sync run with ID {run_id}"
+            ) from None
+    return CensusSyncRunStatus(run_data["status"]), run_data
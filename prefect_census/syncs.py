@@ -1,7 +1,11 @@
 """Module containing tasks and flows for interacting with Census syncs."""
 import asyncio
-from typing import Any, Dict
+import random
+import time
+from logging import Logger
+from typing import Any, Dict, List, Optional, Tuple, Type
 
+import orjson
 from httpx import HTTPStatusError
 from prefect import flow, task
 from prefect.blocks.abstract import JobBlock, JobRun
@@ -14,15 +18,51 @@ if PYDANTIC_VERSION.startswith("2."):
 else:
     from pydantic import BaseModel, Field
 
+from prefect_census.client import CensusClient
 from prefect_census.credentials import CensusCredentials
 from prefect_census.runs import (
+    CensusPollCoordinator,
     CensusSyncRunCancelled,
     CensusSyncRunFailed,
     CensusSyncRunStatus,
     CensusSyncRunTimeout,
+    _check_poll_seconds,
+    _get_run_info_raw,
     wait_census_sync_completion,
 )
-from prefect_census.utils import extract_user_message
+from prefect_census.utils import (
+    extract_user_message,
+    is_client_error,
+    is_transient_error,
+)
+
+# Maximum number of trigger requests `trigger_census_syncs` keeps in flight at once
+_MAX_CONCURRENT_TRIGGERS = 16
+
+# Delays in seconds before each retry of a trigger request, and the fraction of
+# each delay added as random jitter
+_TRIGGER_RETRY_DELAYS = (2, 5, 15)
+_TRIGGER_RETRY_JITTER = 0.5
+
+# Census UI page listing the runs of a sync, formatted lazily by the logger
+_SYNC_HISTORY_URL = "https://app.getcensus.com/sync/%s/sync-history"
+
+# Error raised for a sync run that ended in a status other than completed, with
+# its message template
+_RUN_STATUS_ERRORS: Dict[CensusSyncRunStatus, Tuple[Type[Exception], str]] = {
+    CensusSyncRunStatus.CANCELLED: (
+        CensusSyncRunCancelled,
+        "Triggered sync run with ID {run_id} was cancelled.",
+    ),
+    CensusSyncRunStatus.FAILED: (
+        CensusSyncRunFailed,
+        "Triggered sync run with ID: {run_id} failed.",
+    ),
+}
+_UNEXPECTED_RUN_STATUS_ERROR = (
+    RuntimeError,
+    "Triggered sync run with ID: {run_id} ended with unexpected status {status}",
+)
 
 
 class CensusSyncTriggerFailed(RuntimeError):
@@ -36,25 +76,147 @@ class CensusSyncResult(BaseModel):
     run_data: Dict[str, Any]
 
 
+async def _trigger_sync_run_raw(
+    client: CensusClient, sync_id: int, force_full_sync: bool = False
+) -> Dict[str, Any]:
+    """
+    Triggers a Census sync run using an already opened client.
+
+    Args:
+        client: The Census client to send the request with.
+        sync_id: The ID of the sync to trigger.
+        force_full_sync: If `True`, a full sync will be triggered.
+
+    Raises:
+        CensusSyncTriggerFailed: If the Census API responds with an error.
+
+    Returns:
+        The run data returned by the Census API.
+    """
+    try:
+        response = await client.trigger_sync_run(
+            sync_id=sync_id, force_full_sync=force_full_sync
+        )
+    except HTTPStatusError as e:
+        raise CensusSyncTriggerFailed(extract_user_message(e)) from e
+
+    return orjson.loads(response.content)["data"]
+
+
+async def _trigger_sync_run(
+    client: CensusClient, sync_id: int, force_full_sync: bool, logger: Logger
+) -> Dict[str, Any]:
+    """
+    Triggers a Census sync run using an already opened client, retrying the
+    request with backoff unless Census rejects it with a client error.
+
+    Prefect runs each task call, and each retry of one, on an event loop of its
+    own, where a client opened elsewhere cannot be used. Retrying here instead of
+    through Prefect keeps every attempt on `client`.
+    """
+    logger.info("Triggering Census sync run for sync with ID %s", sync_id)
+    for delay in (*_TRIGGER_RETRY_DELAYS, None):
+        try:
+            run_data = await _trigger_sync_run_raw(client, sync_id, force_full_sync)
+            break
+        except Exception as exc:
+            if delay is None or is_client_error(exc):
+                raise
+            delay *= 1 + random.random() * _TRIGGER_RETRY_JITTER
+            logger.warning(
+                "Triggering Census sync run for sync with ID %s failed with %r. "
+                "Retrying in %.1f seconds.",
+                sync_id,
+                exc,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    try:
+        run_id = run_data["sync_run_id"]
+    except KeyError:
+        pass
+    else:
+        logger.info(
+            "Census sync run with ID %s successfully triggered for sync with ID %s. "
+            "You can view the status of this sync run at " + _SYNC_HISTORY_URL,
+            run_id,
+            sync_id,
+            sync_id,
+        )
+
+    return run_data
+
+
+async def _trigger_sync_runs(
+    client: CensusClient, sync_ids: List[int], force_full_sync: bool, logger: Logger
+) -> Dict[int, int]:
+    """
+    Triggers a Census sync run for each of the given syncs concurrently using an
+    already opened client, and returns the ID of each triggered run by sync ID.
+    """
+    if len(set(sync_ids)) != len(sync_ids):
+        raise ValueError(
+            f"Sync IDs must be unique, since each maps to a single run, got {sync_ids}."
+        )
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_TRIGGERS)
+
+    async def trigger(sync_id: int) -> int:
+        async with semaphore:
+            run_data = await _trigger_sync_run_raw(client, sync_id, force_full_sync)
+        return run_data["sync_run_id"]
+
+    logger.info("Triggering Census sync runs for syncs with IDs %s", sync_ids)
+    results = await asyncio.gather(
+        *(trigger(sync_id) for sync_id in sync_ids), return_exceptions=True
+    )
+
+    run_ids = {}
+    errors = {}
+    for sync_id, result in zip(sync_ids, results):
+        if isinstance(result, BaseException):
+            errors[sync_id] = result
+        else:
+            run_ids[sync_id] = result
+
+    if errors:
+        raise CensusSyncTriggerFailed(
+            f"Triggering sync runs failed for syncs with IDs {list(errors)}: "
+            + "; ".join(f"{sync_id}: {error}" for sync_id, error in errors.items())
+            + f". Sync runs were started for the other syncs: {run_ids}"
+        ) from next(iter(errors.values()))
+
+    return run_ids
+
+
 @task(
     name="Trigger Census sync run",
     description="Triggers a Census sync run for the sync with the given sync_id.",
-    retries=3,
-    retry_delay_seconds=10,
 )
 async def trigger_census_sync(
-    credentials: CensusCredentials, sync_id: int, force_full_sync: bool = False
-) -> int:
+    credentials: CensusCredentials,
+    sync_id: int,
+    force_full_sync: bool = False,
+    client: Optional[CensusClient] = None,
+) -> Dict[str, Any]:
     """
     A task to trigger a Census sync run.
 
+    A failed trigger request is retried up to 3 times with backoff, unless Census
+    rejects it with a client error. All attempts are sent over the same client.
+
     Args:
         credentials: Credentials for authenticating with Census.
         sync_id: The ID of the sync to trigger.
         force_full_sync: If `True`, a full sync will be triggered.
+        client: An already opened Census client to send the request with. If not
+            provided, the client shared by `credentials` on the running event loop
+            is used.
 
     Returns:
-        The ID of the triggered sync run.
+        The data returned by the Census API for the triggered sync run, including
+            its ID as `sync_run_id`.
 
     Examples:
         Trigger a Census sync run:
@@ -74,25 +236,63 @@ async def trigger_census_sync(
     """
     logger = get_run_logger()
 
-    logger.info(f"Triggering Census sync run for sync with ID {sync_id}")
-    try:
-        async with credentials.get_client() as client:
-            response = await client.trigger_sync_run(
-                sync_id=sync_id, force_full_sync=force_full_sync
-            )
-    except HTTPStatusError as e:
-        raise CensusSyncTriggerFailed(extract_user_message(e)) from e
+    if client is None:
+        async with credentials.shared_client() as client:
+            return await _trigger_sync_run(client, sync_id, force_full_sync, logger)
+    return await _trigger_sync_run(client, sync_id, force_full_sync, logger)
 
-    run_data = response.json()["data"]
 
-    if "sync_run_id" in run_data:
-        logger.info(
-            f"Census sync run successfully triggered for sync with ID {sync_id}. "
-            "You can view the status of this sync run at "
-            f"https://app.getcensus.com/sync/{sync_id}/sync-history"
-        )
+@task(
+    name="Trigger Census sync runs",
+    description="Triggers a Census sync run for each of the given sync_ids.",
+)
+async def trigger_census_syncs(
+    credentials: CensusCredentials,
+    sync_ids: List[int],
+    force_full_sync: bool = False,
+) -> Dict[int, int]:
+    """
+    A task to trigger Census sync runs for several syncs concurrently.
+
+    All trigger requests are sent over the client shared by `credentials`, with at
+    most 16 of them in flight at once. Unlike `trigger_census_sync`, this task is
+    not retried, since a retry would trigger the syncs that already started a
+    second time.
 
-    return run_data["sync_run_id"]
+    Args:
+        credentials: Credentials for authenticating with Census.
+        sync_ids: The IDs of the syncs to trigger.
+        force_full_sync: If `True`, a full sync will be triggered for every sync.
+
+    Raises:
+        ValueError: If a sync ID is given more than once.
+        CensusSyncTriggerFailed: If triggering any of the syncs fails. It is only
+            raised once all trigger requests have finished, and names the IDs of
+            the syncs that could not be triggered as well as the runs that started.
+
+    Returns:
+        A dictionary mapping each sync ID to the ID of its triggered sync run.
+
+    Examples:
+        Trigger Census sync runs for several syncs:
+        ```python
+        from prefect import flow
+
+        from prefect_census import CensusCredentials
+        from prefect_census.syncs import trigger_census_syncs
+
+        @flow
+        def trigger_census_syncs_flow():
+            credentials = CensusCredentials(api_key="my_api_key")
+            trigger_census_syncs(credentials=credentials, sync_ids=[42, 43])
+
+        trigger_census_syncs_flow()
+        ```
+    """
+    async with credentials.shared_client() as client:
+        return await _trigger_sync_runs(
+            client, sync_ids, force_full_sync, get_run_logger()
+        )
 
 
 @flow(
@@ -104,8 +304,10 @@ async def trigger_census_sync_run_and_wait_for_completion(
     credentials: CensusCredentials,
     sync_id: int,
     force_full_sync: bool = False,
-    max_wait_seconds: int = 900,
-    poll_frequency_seconds: int = 10,
+    max_wait_seconds: float = 900,
+    poll_frequency_seconds: float = 10,
+    initial_poll_seconds: float = 1.0,
+    completion_event: Optional[asyncio.Event] = None,
 ) -> Dict[str, Any]:
     """
     Flow that triggers a sync run and waits for the triggered run to complete.
@@ -115,11 +317,19 @@ async def trigger_census_sync_run_and_wait_for_completion(
         sync_id: The ID of the sync to trigger.
         force_full_sync: If `True`, a full sync will be triggered.
         max_wait_seconds: Maximum number of seconds to wait for sync to complete
-        poll_frequency_seconds: Number of seconds to wait in between checks for run completion.
+        poll_frequency_seconds: Maximum number of seconds to wait in between checks for run
+            completion.
+        initial_poll_seconds: Number of seconds to wait after the first check for run completion.
+            The wait doubles after every subsequent check, up to `poll_frequency_seconds`.
+        completion_event: An event set when Census reports the end of the triggered run,
+            e.g. by a handler for Census sync alert webhooks. If given, the run status is
+            only checked once the event is set instead of being polled for in the meantime.
 
     Raises:
+        ValueError: A poll interval is not positive.
         CensusSyncRunCancelled: The triggered Census sync run was cancelled.
         CensusSyncRunFailed: The triggered Census sync run failed.
+        CensusSyncRunTimeout: The triggered Census sync run did not complete in time.
         RuntimeError: The triggered Census sync run ended in an unexpected state.
 
     Returns:
@@ -189,41 +399,174 @@ async def trigger_census_sync_run_and_wait_for_completion(
         my_flow()
         ```
     """  # noqa
+    _check_poll_seconds(poll_frequency_seconds, initial_poll_seconds)
     logger = get_run_logger()
 
-    triggered_run_data_future = await trigger_census_sync.submit(
-        credentials=credentials, sync_id=sync_id, force_full_sync=force_full_sync
-    )
+    # Sends the trigger and all status checks of this flow over one client. The
+    # trigger is sent from the flow itself, since a task would run on an event
+    # loop of its own and need a client of its own.
+    async with credentials.shared_client() as client:
+        triggered_run_data = await _trigger_sync_run(
+            client, sync_id, force_full_sync, logger
+        )
+        run_id = triggered_run_data["sync_run_id"]
+        if run_id is None:
+            raise RuntimeError("Unable to determine run ID for triggered sync.")
 
-    run_id = await triggered_run_data_future.result()
-    if run_id is None:
-        raise RuntimeError("Unable to determine run ID for triggered sync.")
+        if completion_event is not None:
+            deadline = time.monotonic() + max_wait_seconds
+            try:
+                await asyncio.wait_for(completion_event.wait(), max_wait_seconds)
+            except asyncio.TimeoutError:
+                raise CensusSyncRunTimeout(
+                    f"Max wait time of {max_wait_seconds} seconds exceeded while "
+                    f"waiting for the completion event of sync run with ID {run_id}."
+                ) from None
+            # The first status check happens right away, so a finished run costs a
+            # single request; an event set early falls back to polling for the rest.
+            max_wait_seconds = max(deadline - time.monotonic(), 0)
+
+        final_run_status, run_data = await wait_census_sync_completion(
+            run_id=run_id,
+            credentials=credentials,
+            max_wait_seconds=max_wait_seconds,
+            poll_frequency_seconds=poll_frequency_seconds,
+            initial_poll_seconds=initial_poll_seconds,
+        )
 
-    final_run_status, run_data = await wait_census_sync_completion(
-        run_id=run_id,
-        credentials=credentials,
-        max_wait_seconds=max_wait_seconds,
-        poll_frequency_seconds=poll_frequency_seconds,
-    )
+    _check_final_run_status(run_id, final_run_status, logger)
+    return run_data
 
-    if final_run_status == CensusSyncRunStatus.COMPLETED:
-        logger.info(
-            "Census sync run with ID %s completed successfully!",
-            run_id,
-        )
-        return run_data
 
-    elif final_run_status == CensusSyncRunStatus.CANCELLED:
-        raise CensusSyncRunCancelled(
-            f"Triggered sync run with ID {run_id} was cancelled."
-        )
-    elif final_run_status == CensusSyncRunStatus.FAILED:
-        raise CensusSyncRunFailed(f"Triggered sync run with ID: {run_id} failed.")
-    else:
-        raise RuntimeError(
-            f"Triggered sync run with ID: {run_id} ended with unexpected"
-            f"status {final_run_status}"
+@flow(
+    name="Trigger Census syncs and wait for completion",
+    description="Triggers a Census sync run for each of the given sync_ids and "
+    "waits for all triggered runs to complete.",
+)
+async def trigger_census_syncs_and_wait_for_completion(
+    credentials: CensusCredentials,
+    sync_ids: List[int],
+    force_full_sync: bool = False,
+    max_wait_seconds: float = 900,
+    poll_frequency_seconds: float = 10,
+    initial_poll_seconds: float = 1.0,
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Flow that triggers sync runs for several syncs and waits for all triggered
+    runs to complete.
+
+    The runs are polled together by one `CensusPollCoordinator` over the client
+    shared by `credentials`, and each run is reported as soon as it finishes.
+
+    Args:
+        credentials: Credentials for authenticating with Census.
+        sync_ids: The IDs of the syncs to trigger.
+        force_full_sync: If `True`, a full sync will be triggered for every sync.
+        max_wait_seconds: Maximum number of seconds to wait for all syncs to complete.
+        poll_frequency_seconds: Maximum number of seconds to wait in between checks
+            for completion of a run.
+        initial_poll_seconds: Number of seconds to wait after the first check for
+            completion of a run. The wait doubles after every subsequent check, up to
+            `poll_frequency_seconds`.
+
+    Raises:
+        ValueError: A poll interval is not positive, or a sync ID is given more than
+            once.
+        CensusSyncTriggerFailed: Triggering any of the syncs failed. The error names
+            the sync runs that did start, which are not waited for.
+        CensusSyncRunCancelled: One of the triggered Census sync runs was cancelled.
+        CensusSyncRunFailed: One of the triggered Census sync runs failed.
+        CensusSyncRunTimeout: Not all triggered Census sync runs completed in time.
+        RuntimeError: One of the triggered Census sync runs ended in an unexpected
+            state.
+
+    Returns:
+        A dictionary mapping each sync ID to the final run data of its triggered
+            sync run, in the shape returned by
+            `trigger_census_sync_run_and_wait_for_completion`.
+
+    Example:
+        Trigger several Census syncs and wait for all of them to complete:
+        ```python
+        from prefect import flow
+
+        from prefect_census import CensusCredentials
+        from prefect_census.syncs import trigger_census_syncs_and_wait_for_completion
+
+        @flow
+        def my_flow():
+            ...
+            creds = CensusCredentials(api_key="my_api_key")
+            run_results = trigger_census_syncs_and_wait_for_completion(
+                credentials=creds,
+                sync_ids=[42, 43]
+            )
+            ...
+
+        my_flow()
+        ```
+    """  # noqa
+    _check_poll_seconds(poll_frequency_seconds, initial_poll_seconds)
+    logger = get_run_logger()
+
+    # As in `trigger_census_sync_run_and_wait_for_completion`, the triggers are
+    # sent from the flow itself over the client shared with the status checks
+    async with credentials.shared_client() as client:
+        run_ids = await _trigger_sync_runs(client, sync_ids, force_full_sync, logger)
+
+        coordinator = CensusPollCoordinator.for_client(client)
+        deadline = time.monotonic() + max_wait_seconds
+        waits = {
+            asyncio.ensure_future(
+                coordinator.wait_for_terminal(
+                    run_id,
+                    deadline,
+                    poll_frequency_seconds=poll_frequency_seconds,
+                    initial_poll_seconds=initial_poll_seconds,
+                    logger=logger,
+                )
+            ): sync_id
+            for sync_id, run_id in run_ids.items()
+        }
+
+        results = {}
+        pending = set(waits)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for wait in done:
+                    sync_id = waits[wait]
+                    run_data = wait.result()
+                    _check_final_run_status(
+                        run_ids[sync_id],
+                        CensusSyncRunStatus(run_data["status"]),
+                        logger,
+                    )
+                    results[sync_id] = run_data
+        finally:
+            for wait in pending:
+                wait.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    return results
+
+
+def _check_final_run_status(
+    run_id: int, final_run_status: CensusSyncRunStatus, logger: Logger
+) -> None:
+    """Logs a completed sync run, or raises for a run that did not complete."""
+    if final_run_status != CensusSyncRunStatus.COMPLETED:
+        error, message = _RUN_STATUS_ERRORS.get(
+            final_run_status, _UNEXPECTED_RUN_STATUS_ERROR
         )
+        raise error(message.format(run_id=run_id, status=final_run_status.value))
+
+    logger.info(
+        "Census sync run with ID %s completed successfully!",
+        run_id,
+    )
 
 
 class CensusSync(JobBlock):
@@ -294,28 +637,25 @@ class CensusSync(JobBlock):
         Returns:
             A CensusSyncRun instance representing the triggered sync run.
         """
-        self.logger.info(f"Triggering Census sync run for sync with ID {self.sync_id}")
-        try:
-            async with self.credentials.get_client() as client:
-                response = await client.trigger_sync_run(
-                    sync_id=self.sync_id, force_full_sync=self.force_full_sync
-                )
-        except HTTPStatusError as e:
-            raise CensusSyncTriggerFailed(extract_user_message(e)) from e
-
-        run_data = response.json()["data"]
+        logger = self.logger
 
-        if "sync_run_id" in run_data:
-            self.logger.info(
-                f"Census sync with ID: {self.sync_id} successfully triggered. "
-                "You can view the status of this sync run at "
-                f"https://app.getcensus.com/sync/{self.sync_id}/sync-history"
+        logger.info("Triggering Census sync run for sync with ID %s", self.sync_id)
+        async with self.credentials.get_client() as client:
+            run_data = await _trigger_sync_run_raw(
+                client, self.sync_id, self.force_full_sync
             )
 
         run_id = run_data["sync_run_id"]
         if run_id is None:
             raise RuntimeError("Unable to determine run ID for triggered sync.")
 
+        logger.info(
+            "Census sync with ID: %s successfully triggered. "
+            "You can view the status of this sync run at " + _SYNC_HISTORY_URL,
+            self.sync_id,
+            self.sync_id,
+        )
+
         return CensusSyncRun(census_sync=self, run_id=run_id)
 
 
@@ -339,50 +679,46 @@ class CensusSyncRun(JobRun):
     @sync_compatible
     async def wait_for_completion(self):
         """Wait for the Census sync run to complete."""
-        seconds_waited_for_run_completion = 0
+        logger = self.logger
+        deadline = time.monotonic() + self.sync.max_wait_seconds
         last_status = None
-        while seconds_waited_for_run_completion <= self.sync.max_wait_seconds:
-            try:
-                async with self.sync.credentials.get_client() as client:
-                    response = await client.get_run_info(self.run_id)
-            except HTTPStatusError as e:
-                raise RuntimeError(extract_user_message(e)) from e
-
-            run_data = response.json()["data"]
-            self.status = run_data.get("status")
-
-            if CensusSyncRunStatus.is_terminal_status_code(self.status):
-                self.run_data = run_data
-                if self.status == CensusSyncRunStatus.COMPLETED.value:
-                    self.logger.info(
-                        "Census sync run with ID %s completed successfully!",
+        async with self.sync.credentials.get_client() as client:
+            while True:
+                try:
+                    run_data = await _get_run_info_raw(client, self.run_id)
+                except Exception as exc:
+                    if not is_transient_error(exc) or time.monotonic() >= deadline:
+                        raise
+                    logger.warning(
+                        "Checking the status of Census sync run with ID %i failed "
+                        "with %r.",
                         self.run_id,
-                    )
-                    return
-
-                elif self.status == CensusSyncRunStatus.CANCELLED.value:
-                    raise CensusSyncRunCancelled(
-                        f"Triggered sync run with ID {self.run_id} was cancelled."
-                    )
-                elif self.status == CensusSyncRunStatus.FAILED.value:
-                    raise CensusSyncRunFailed(
-                        f"Triggered sync run with ID {self.run_id} has failed."
+                        exc,
                     )
                 else:
-                    raise RuntimeError(
-                        f"Sync run with ID: {self.run_id} ended with unexpected "
-                        f"status {self.status}"
-                    )
-            if self.status != last_status:
-                self.logger.info(
-                    "Census sync run with ID %i has status %s.",
-                    self.run_id,
-                    CensusSyncRunStatus(self.status).name,
+                    self.status = run_data.get("status")
+
+                    if CensusSyncRunStatus.is_terminal_status_code(self.status):
+                        self.run_data = run_data
+                        _check_final_run_status(
+                            self.run_id, CensusSyncRunStatus(self.status), logger
+                        )
+                        return
+                    if self.status != last_status:
+                        logger.info(
+                            "Census sync run with ID %i has status %s.",
+                            self.run_id,
+                            CensusSyncRunStatus(self.status).name,
+                        )
+                        last_status = self.status
+
+                seconds_remaining = deadline - time.monotonic()
+                if seconds_remaining <= 0:
+                    break
+
+                await asyncio.sleep(
+                    min(self.sync.poll_frequency_seconds, seconds_remaining)
                 )
-                last_status = self.status
-
-            await asyncio.sleep(self.sync.poll_frequency_seconds)
-            seconds_waited_for_run_completion += self.sync.poll_frequency_seconds
 
         raise CensusSyncRunTimeout(
             f"Timeout of {self.sync.max_wait_seconds} seconds exceeded while "
@@ -1,8 +1,10 @@
 """Utilities for common interactions with the Census API"""
-from json import JSONDecodeError
 from typing import Optional
 
-from httpx import HTTPStatusError
+import orjson
+from httpx import HTTPStatusError, TransportError
+from prefect import Task
+from prefect.client.schemas.objects import State, TaskRun
 
 
 def extract_user_message(error: HTTPStatusError) -> Optional[str]:
@@ -17,8 +19,69 @@ def extract_user_message(error: HTTPStatusError) -> Optional[str]:
             be extracted.
     """
     try:
-        response_payload = error.response.json()
-        user_message = response_payload.get("status", None)
-        return user_message
-    except JSONDecodeError:
+        response_payload = orjson.loads(error.response.content)
+        return response_payload.get("status")
+    except orjson.JSONDecodeError:
         pass
+
+
+def is_client_error(error: BaseException) -> bool:
+    """
+    Determine whether Census rejected a request with a client error, which
+    sending the request again would only repeat. Rate limited requests (429)
+    are not client errors in this sense.
+
+    Args:
+        error: The exception raised for the request, either the HTTPStatusError
+            raised by httpx or an exception raised from it.
+
+    Returns:
+        Whether the request failed with a client error.
+    """
+    if not isinstance(error, HTTPStatusError):
+        error = error.__cause__
+    if not isinstance(error, HTTPStatusError):
+        return False
+    status_code = error.response.status_code
+    return 400 <= status_code < 500 and status_code != 429
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Determine whether a request to Census failed in a way that sending it
+    again may fix: a transport error such as a timeout, rate limiting or a
+    server error.
+
+    Args:
+        error: The exception raised for the request, either the exception
+            raised by httpx or an exception raised from it.
+
+    Returns:
+        Whether the request may succeed when sent again.
+    """
+    if isinstance(error, TransportError):
+        return True
+    if not isinstance(error, HTTPStatusError):
+        error = error.__cause__
+    return isinstance(error, HTTPStatusError) and not is_client_error(error)
+
+
+def retry_unless_client_error(task: Task, task_run: TaskRun, state: State) -> bool:
+    """
+    Retry condition for tasks sending a request to the Census API: failed
+    requests are retried unless Census rejected them with a client error, which
+    a retry would only repeat. Rate limited requests (429) are still retried.
+
+    Args:
+        task: The task that failed.
+        task_run: The failed task run.
+        state: The failed state of the task run.
+
+    Returns:
+        Whether the task run should be retried.
+    """
+    try:
+        state.result()
+    except Exception as exc:
+        return not is_client_error(exc)
+    return True
@@ -26,7 +26,10 @@ setup(
     packages=find_packages(exclude=("tests", "docs")),
     python_requires=">=3.7",
     install_requires=install_requires,
-    extras_require={"dev": dev_requires},
+    extras_require={
+        "dev": dev_requires,
+        "uvloop": ["uvloop; sys_platform != 'win32'"],
+    },
     entry_points={
         "prefect.collections": [
             "prefect_census = prefect_census",
@@ -2,13 +2,20 @@ import pytest
 from httpx import Response
 from prefect.testing.utilities import prefect_test_harness
 
+from prefect_census.credentials import CensusCredentials
 
-@pytest.fixture(autouse=True)
+
+@pytest.fixture(scope="session", autouse=True)
 def prefect_db():
     with prefect_test_harness():
         yield
 
 
+@pytest.fixture(scope="module")
+def census_credentials():
+    return CensusCredentials(api_key="my_api_key")
+
+
 @pytest.fixture
 def mock_successful_sync_calls(respx_mock):
     respx_mock.post(
@@ -168,22 +175,8 @@ def mock_sync_timed_out(respx_mock):
         "https://app.getcensus.com/api/v1/sync_runs/12345",  # noqa
         headers={"Authorization": "Bearer my_api_key"},
     ).mock(
-        side_effect=[
-            Response(
-                200,
-                json={"data": {"id": 5, "sync_run_id": 12345, "status": "working"}},
-            ),
-            Response(
-                200,
-                json={"data": {"id": 5, "sync_run_id": 12345, "status": "working"}},
-            ),
-            Response(
-                200,
-                json={"data": {"id": 5, "sync_run_id": 12345, "status": "working"}},
-            ),
-            Response(
-                200,
-                json={"data": {"id": 5, "sync_run_id": 12345, "status": "working"}},
-            ),
-        ]
+        return_value=Response(
+            200,
+            json={"data": {"id": 5, "sync_run_id": 12345, "status": "working"}},
+        )
     )
@@ -0,0 +1,52 @@
+import asyncio
+
+from prefect_census.credentials import CensusCredentials, _shared_clients
+
+
+class TestSharedClient:
+    async def test_shared_within_loop(self):
+        async with CensusCredentials(api_key="my_api_key").shared_client() as client:
+            other_credentials = CensusCredentials(api_key="my_api_key")
+            async with other_credentials.shared_client() as other_client:
+                assert client is other_client
+            assert not client.client.is_closed
+
+        assert client.client.headers["Authorization"] == "Bearer my_api_key"
+
+    async def test_not_shared_across_api_keys(self):
+        async with CensusCredentials(api_key="my_api_key").shared_client() as client:
+            other_credentials = CensusCredentials(api_key="other_key")
+            async with other_credentials.shared_client() as other_client:
+                assert client is not other_client
+
+    async def test_closed_after_last_user(self):
+        credentials = CensusCredentials(api_key="my_api_key")
+        async with credentials.shared_client() as client:
+            pass
+
+        assert client.client.is_closed
+        assert not _shared_clients[asyncio.get_running_loop()]
+
+        async with credentials.shared_client() as other_client:
+            assert other_client is not client
+
+    async def test_replaced_once_closed(self):
+        credentials = CensusCredentials(api_key="my_api_key")
+        async with credentials.shared_client() as client:
+            await client.client.aclose()
+
+            async with credentials.shared_client() as other_client:
+                assert other_client is not client
+                assert not other_client.client.is_closed
+
+    async def test_not_shared_across_loops(self):
+        credentials = CensusCredentials(api_key="my_api_key")
+
+        async def get_client():
+            async with credentials.shared_client() as client:
+                return client
+
+        async with credentials.shared_client() as client:
+            other_client = await asyncio.to_thread(asyncio.run, get_client())
+
+        assert client is not other_client
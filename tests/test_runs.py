@@ -1,13 +1,15 @@
-import pytest
-from httpx import Response
-
-from prefect_census.credentials import CensusCredentials
-from prefect_census.runs import CensusGetSyncRunInfoFailed, get_census_sync_run_info
+import asyncio
+import time
 
+import pytest
+from httpx import ReadTimeout, Response
 
-@pytest.fixture
-def census_credentials():
-    return CensusCredentials(api_key="my_api_key")
+from prefect_census.runs import (
+    CensusGetSyncRunInfoFailed,
+    CensusPollCoordinator,
+    CensusSyncRunTimeout,
+    get_census_sync_run_info,
+)
 
 
 class TestGetCensusSyncRunInfo:
@@ -26,3 +28,139 @@ class TestGetCensusSyncRunInfo:
         ).mock(return_value=Response(404, json={"status": {"message": "Not found!"}}))
         with pytest.raises(CensusGetSyncRunInfoFailed, match="Not found!"):
             await get_census_sync_run_info.fn(credentials=census_credentials, run_id=4)
+
+    async def test_get_census_sync_run_info_with_client(
+        self, respx_mock, census_credentials
+    ):
+        respx_mock.get(
+            "https://app.getcensus.com/api/v1/sync_runs/42",  # noqa
+            headers={"Authorization": "Bearer my_api_key"},
+        ).mock(return_value=Response(200, json={"data": {"sync_run_id": 42}}))
+
+        async with census_credentials.get_client() as client:
+            result = await get_census_sync_run_info.fn(
+                credentials=census_credentials, run_id=42, client=client
+            )
+            assert not client.client.is_closed
+
+        assert result == {"sync_run_id": 42}
+
+
+@pytest.fixture
+async def census_client(census_credentials):
+    async with census_credentials.shared_client() as client:
+        yield client
+
+
+class TestCensusPollCoordinator:
+    async def test_wait_for_many_runs(self, respx_mock, census_client):
+        respx_mock.get(
+            "https://app.getcensus.com/api/v1/sync_runs/1",  # noqa
+            headers={"Authorization": "Bearer my_api_key"},
+        ).mock(
+            side_effect=[
+                Response(200, json={"data": {"id": 1, "status": "working"}}),
+                Response(200, json={"data": {"id": 1, "status": "completed"}}),
+            ]
+        )
+        respx_mock.get(
+            "https://app.getcensus.com/api/v1/sync_runs/2",  # noqa
+            headers={"Authorization": "Bearer my_api_key"},
+        ).mock(
+            return_value=Response(200, json={"data": {"id": 2, "status": "failed"}})
+        )
+
+        coordinator = CensusPollCoordinator.for_client(census_client)
+        assert CensusPollCoordinator.for_client(census_client) is coordinator
+
+        deadline = time.monotonic() + 5
+        results = await asyncio.gather(
+            coordinator.wait_for_terminal(1, deadline, poll_frequency_seconds=0.01),
+            coordinator.wait_for_terminal(2, deadline, poll_frequency_seconds=0.01),
+        )
+
+        assert results == [
+            {"id": 1, "status": "completed"},
+            {"id": 2, "status": "failed"},
+        ]
+
+    async def test_wait_times_out(self, respx_mock, census_client):
+        respx_mock.get(
+            "https://app.getcensus.com/api/v1/sync_runs/1",  # noqa
+            headers={"Authorization": "Bearer my_api_key"},
+        ).mock(
+            return_value=Response(200, json={"data": {"id": 1, "status": "working"}})
+        )
+
+        coordinator = CensusPollCoordinator.for_client(census_client)
+
+        with pytest.raises(CensusSyncRunTimeout):
+            await coordinator.wait_for_terminal(
+                1, time.monotonic() + 0.05, poll_frequency_seconds=0.01
+            )
+
+    async def test_wait_for_nonexistent_run(self, respx_mock, census_client):
+        respx_mock.get(
+            "https://app.getcensus.com/api/v1/sync_runs/4",  # noqa
+            headers={"Authorization": "Bearer my_api_key"},
+        ).mock(return_value=Response(404, json={"status": {"message": "Not found!"}}))
+
+        coordinator = CensusPollCoordinator.for_client(census_client)
+
+        with pytest.raises(CensusGetSyncRunInfoFailed, match="Not found!"):
+            await coordinator.wait_for_terminal(4, time.monotonic() + 5)
+
+    async def test_wait_survives_transient_errors(
+        self, respx_mock, census_client
+    ):
+        respx_mock.get(
+            "https://app.getcensus.com/api/v1/sync_runs/1",  # noqa
+            headers={"Authorization": "Bearer my_api_key"},
+        ).mock(
+            side_effect=[
+                Response(200, json={"data": {"id": 1, "status": "working"}}),
+                Response(503, json={"status": {"message": "unavailable"}}),
+                Response(429, json={"status": {"message": "slow down"}}),
+                ReadTimeout("timed out"),
+                Response(200, json={"data": {"id": 1, "status": "completed"}}),
+            ]
+        )
+
+        coordinator = CensusPollCoordinator.for_client(census_client)
+
+        result = await coordinator.wait_for_terminal(
+            1, time.monotonic() + 5, poll_frequency_seconds=0.01
+        )
+
+        assert result == {"id": 1, "status": "completed"}
+
+    async def test_unexpected_status_fails_only_its_run(
+        self, respx_mock, census_client
+    ):
+        respx_mock.get(
+            "https://app.getcensus.com/api/v1/sync_runs/1",  # noqa
+            headers={"Authorization": "Bearer my_api_key"},
+        ).mock(
+            side_effect=[
+                Response(200, json={"data": {"id": 1, "status": "working"}}),
+                Response(200, json={"data": {"id": 1, "status": "completed"}}),
+            ]
+        )
+        respx_mock.get(
+            "https://app.getcensus.com/api/v1/sync_runs/2",  # noqa
+            headers={"Authorization": "Bearer my_api_key"},
+        ).mock(
+            return_value=Response(200, json={"data": {"id": 2, "status": "weird"}})
+        )
+
+        coordinator = CensusPollCoordinator.for_client(census_client)
+
+        deadline = time.monotonic() + 5
+        results = await asyncio.gather(
+            coordinator.wait_for_terminal(1, deadline, poll_frequency_seconds=0.01),
+            coordinator.wait_for_terminal(2, deadline, poll_frequency_seconds=0.01),
+            return_exceptions=True,
+        )
+
+        assert results[0] == {"id": 1, "status": "completed"}
+        assert isinstance(results[1], ValueError)
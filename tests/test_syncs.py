@@ -1,6 +1,10 @@
+import asyncio
+
 import pytest
+from httpx import Response
 from prefect import flow
 
+from prefect_census.client import CensusClient
 from prefect_census.credentials import CensusCredentials
 from prefect_census.flows import run_census_sync
 from prefect_census.runs import (
@@ -13,18 +17,29 @@ from prefect_census.syncs import (
     CensusSyncTriggerFailed,
     trigger_census_sync,
     trigger_census_sync_run_and_wait_for_completion,
+    trigger_census_syncs,
+    trigger_census_syncs_and_wait_for_completion,
 )
 
 
 @pytest.fixture
-def census_credentials():
-    return CensusCredentials(api_key="my_api_key")
+def shared_clients(monkeypatch):
+    """Records every client created for `CensusCredentials.shared_client`."""
+    clients = []
+
+    def recording_client(**kwargs):
+        client = CensusClient(**kwargs)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr("prefect_census.credentials.CensusClient", recording_client)
+    return clients
 
 
 @pytest.fixture
-def census_sync():
+def census_sync(census_credentials):
     return CensusSync(
-        credentials=CensusCredentials(api_key="my_api_key"),
+        credentials=census_credentials,
         sync_id=5,
     )
 
@@ -36,10 +51,10 @@ class TestTriggerCensusSyncRun:
             return await trigger_census_sync(credentials=census_credentials, sync_id=45)
 
         result = await test_flow()
-        assert result == 45
+        assert result == {"sync_run_id": 45}
 
     async def test_trigger_nonexistent_sync(
-        self, mock_sync_not_found, census_credentials
+        self, mock_sync_not_found, census_credentials, respx_mock
     ):
         @flow
         async def test_trigger_nonexistent_job():
@@ -47,6 +62,134 @@ class TestTriggerCensusSyncRun:
 
         with pytest.raises(CensusSyncTriggerFailed, match="Not found!"):
             await test_trigger_nonexistent_job()
+        # Client errors are not retried
+        assert len(respx_mock.calls) == 1
+
+    async def test_trigger_sync_retries_reuse_client(
+        self, respx_mock, census_credentials, shared_clients, monkeypatch
+    ):
+        monkeypatch.setattr("prefect_census.syncs._TRIGGER_RETRY_DELAYS", (0, 0, 0))
+        route = respx_mock.post(
+            "https://app.getcensus.com/api/v1/syncs/45/trigger",
+            headers={"Authorization": "Bearer my_api_key"},
+        )
+        route.side_effect = [
+            Response(503, json={"status": {"message": "unavailable"}}),
+            Response(429, json={"status": {"message": "slow down"}}),
+            Response(200, json={"data": {"sync_run_id": 45}}),
+        ]
+
+        @flow
+        async def test_flow():
+            return await trigger_census_sync(credentials=census_credentials, sync_id=45)
+
+        result = await test_flow()
+        assert result == {"sync_run_id": 45}
+        assert route.call_count == 3
+        assert len(shared_clients) == 1
+        assert shared_clients[0].client.is_closed
+
+    async def test_trigger_sync_per_api_key(self, respx_mock):
+        url = "https://app.getcensus.com/api/v1/syncs/45/trigger"
+        route = respx_mock.post(url, headers={"Authorization": "Bearer my_api_key"})
+        route.mock(return_value=Response(200, json={"data": {"sync_run_id": 1}}))
+        other_route = respx_mock.post(
+            url, headers={"Authorization": "Bearer other_api_key"}
+        )
+        other_route.mock(
+            return_value=Response(200, json={"data": {"sync_run_id": 2}})
+        )
+
+        @flow
+        async def test_flow():
+            run_data = await trigger_census_sync(
+                credentials=CensusCredentials(api_key="my_api_key"), sync_id=45
+            )
+            other_run_data = await trigger_census_sync(
+                credentials=CensusCredentials(api_key="other_api_key"), sync_id=45
+            )
+            return run_data, other_run_data
+
+        result = await test_flow()
+        assert result == ({"sync_run_id": 1}, {"sync_run_id": 2})
+        assert route.call_count == 1
+        assert other_route.call_count == 1
+
+    async def test_trigger_sync_repeated_within_flow_run(
+        self, mock_trigger_sync_calls, census_credentials, respx_mock
+    ):
+        @flow
+        async def test_flow():
+            for _ in range(2):
+                await trigger_census_sync(credentials=census_credentials, sync_id=45)
+
+        await test_flow()
+        assert len(respx_mock.calls) == 2
+
+
+class TestTriggerCensusSyncs:
+    async def test_trigger_syncs(self, respx_mock, census_credentials):
+        for sync_id in (45, 46):
+            respx_mock.post(
+                f"https://app.getcensus.com/api/v1/syncs/{sync_id}/trigger",
+                headers={"Authorization": "Bearer my_api_key"},
+            ).mock(
+                return_value=Response(
+                    200, json={"data": {"sync_run_id": sync_id + 1000}}
+                )
+            )
+
+        @flow
+        async def test_flow():
+            return await trigger_census_syncs(
+                credentials=census_credentials, sync_ids=[45, 46]
+            )
+
+        result = await test_flow()
+        assert result == {45: 1045, 46: 1046}
+
+    async def test_trigger_syncs_nonexistent_sync(
+        self, mock_trigger_sync_calls, mock_sync_not_found, census_credentials
+    ):
+        @flow
+        async def test_flow():
+            await trigger_census_syncs(
+                credentials=census_credentials, sync_ids=[45, 46]
+            )
+
+        with pytest.raises(CensusSyncTriggerFailed, match="Not found!"):
+            await test_flow()
+
+    async def test_trigger_syncs_reports_started_runs(
+        self, mock_trigger_sync_calls, mock_sync_not_found, census_credentials
+    ):
+        @flow
+        async def test_flow():
+            await trigger_census_syncs(
+                credentials=census_credentials, sync_ids=[45, 46]
+            )
+
+        with pytest.raises(CensusSyncTriggerFailed) as exc_info:
+            await test_flow()
+
+        message = str(exc_info.value)
+        assert "syncs with IDs [46]" in message
+        assert "Not found!" in message
+        assert "started for the other syncs: {45: 45}" in message
+
+    async def test_trigger_syncs_duplicate_sync_ids(
+        self, mock_trigger_sync_calls, census_credentials, respx_mock
+    ):
+        @flow
+        async def test_flow():
+            await trigger_census_syncs(
+                credentials=census_credentials, sync_ids=[45, 45]
+            )
+
+        with pytest.raises(ValueError, match="must be unique"):
+            await test_flow()
+        # Nothing is triggered
+        assert not respx_mock.calls
 
 
 class TestTriggerCensusSyncRunAndWaitForCompletion:
@@ -74,17 +217,72 @@ class TestTriggerCensusSyncRunAndWaitForCompletion:
     ):
 
         result = await trigger_census_sync_run_and_wait_for_completion(
-            credentials=census_credentials, sync_id=5, poll_frequency_seconds=2
+            credentials=census_credentials,
+            sync_id=5,
+            poll_frequency_seconds=0.01,
+            initial_poll_seconds=0.01,
         )
 
         assert result == {"id": 5, "status": "completed", "sync_run_id": 12345}
 
+    async def test_shared_clients_closed(
+        self, mock_successful_sync_with_wait, census_credentials, shared_clients
+    ):
+        await trigger_census_sync_run_and_wait_for_completion(
+            credentials=census_credentials,
+            sync_id=5,
+            poll_frequency_seconds=0.01,
+        )
+
+        # The trigger and the status checks share one client
+        assert len(shared_clients) == 1
+        assert shared_clients[0].client.is_closed
+
+    async def test_trigger_retried_over_flow_client(
+        self, respx_mock, census_credentials, shared_clients, monkeypatch
+    ):
+        monkeypatch.setattr("prefect_census.syncs._TRIGGER_RETRY_DELAYS", (0, 0, 0))
+        trigger_route = respx_mock.post(
+            "https://app.getcensus.com/api/v1/syncs/5/trigger",
+            headers={"Authorization": "Bearer my_api_key"},
+        )
+        trigger_route.side_effect = [
+            Response(503, json={"status": {"message": "unavailable"}}),
+            Response(200, json={"data": {"id": 5, "sync_run_id": 12345}}),
+        ]
+        respx_mock.get(
+            "https://app.getcensus.com/api/v1/sync_runs/12345",
+            headers={"Authorization": "Bearer my_api_key"},
+        ).mock(
+            return_value=Response(
+                200, json={"data": {"id": 5, "status": "completed"}}
+            )
+        )
+
+        result = await trigger_census_sync_run_and_wait_for_completion(
+            credentials=census_credentials, sync_id=5
+        )
+
+        assert result == {"id": 5, "status": "completed"}
+        assert trigger_route.call_count == 2
+        assert len(shared_clients) == 1
+
+    async def test_zero_poll_interval_rejected(self, census_credentials, respx_mock):
+        with pytest.raises(ValueError, match="must be positive"):
+            await trigger_census_sync_run_and_wait_for_completion(
+                credentials=census_credentials,
+                sync_id=5,
+                initial_poll_seconds=0,
+            )
+        # Nothing is triggered
+        assert not respx_mock.calls
+
     async def test_run_failure_with_wait(
         self, mock_failed_sync_with_wait, census_credentials
     ):
         with pytest.raises(CensusSyncRunFailed):
             await trigger_census_sync_run_and_wait_for_completion(
-                credentials=census_credentials, sync_id=5, poll_frequency_seconds=2
+                credentials=census_credentials, sync_id=5, poll_frequency_seconds=0.01
             )
 
     async def test_run_failure_no_run_id(
@@ -92,7 +290,7 @@ class TestTriggerCensusSyncRunAndWaitForCompletion:
     ):
         with pytest.raises(KeyError, match="sync_run_id"):
             await trigger_census_sync_run_and_wait_for_completion(
-                credentials=census_credentials, sync_id=5, poll_frequency_seconds=2
+                credentials=census_credentials, sync_id=5, poll_frequency_seconds=0.01
             )
 
     async def test_run_cancelled_with_wait(
@@ -100,16 +298,115 @@ class TestTriggerCensusSyncRunAndWaitForCompletion:
     ):
         with pytest.raises(CensusSyncRunCancelled):
             await trigger_census_sync_run_and_wait_for_completion(
-                credentials=census_credentials, sync_id=5, poll_frequency_seconds=2
+                credentials=census_credentials, sync_id=5, poll_frequency_seconds=0.01
             )
 
     async def test_run_timed_out(self, mock_sync_timed_out, census_credentials):
-        with pytest.raises(CensusSyncRunTimeout):
+        with pytest.raises(
+            CensusSyncRunTimeout, match="Max wait time of 0.05 seconds exceeded"
+        ):
             await trigger_census_sync_run_and_wait_for_completion(
                 credentials=census_credentials,
                 sync_id=5,
-                poll_frequency_seconds=1,
-                max_wait_seconds=3,
+                poll_frequency_seconds=0.01,
+                max_wait_seconds=0.05,
+            )
+
+    async def test_run_success_with_completion_event(
+        self, mock_successful_sync, census_credentials, respx_mock
+    ):
+        completion_event = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.1, completion_event.set)
+
+        result = await trigger_census_sync_run_and_wait_for_completion(
+            credentials=census_credentials,
+            sync_id=5,
+            completion_event=completion_event,
+        )
+
+        assert result == {"id": 5, "status": "completed", "sync_run_id": 12345}
+        # One trigger request and a single status check
+        assert len(respx_mock.calls) == 2
+
+    async def test_completion_event_timed_out(
+        self, mock_trigger_sync_calls, census_credentials
+    ):
+        with pytest.raises(CensusSyncRunTimeout, match="completion event"):
+            await trigger_census_sync_run_and_wait_for_completion(
+                credentials=census_credentials,
+                sync_id=45,
+                max_wait_seconds=0,
+                completion_event=asyncio.Event(),
+            )
+
+
+class TestTriggerCensusSyncsAndWaitForCompletion:
+    @pytest.fixture
+    def mock_syncs(self, respx_mock):
+        def mock_sync(sync_id, statuses):
+            respx_mock.post(
+                f"https://app.getcensus.com/api/v1/syncs/{sync_id}/trigger",
+                headers={"Authorization": "Bearer my_api_key"},
+            ).mock(
+                return_value=Response(
+                    200, json={"data": {"sync_run_id": sync_id + 1000}}
+                )
+            )
+            respx_mock.get(
+                f"https://app.getcensus.com/api/v1/sync_runs/{sync_id + 1000}",
+                headers={"Authorization": "Bearer my_api_key"},
+            ).mock(
+                side_effect=[
+                    Response(200, json={"data": {"id": sync_id, "status": status}})
+                    for status in statuses
+                ]
+            )
+
+        return mock_sync
+
+    async def test_run_success(self, mock_syncs, census_credentials):
+        mock_syncs(45, ["working", "working", "completed"])
+        mock_syncs(46, ["completed"])
+
+        result = await trigger_census_syncs_and_wait_for_completion(
+            credentials=census_credentials,
+            sync_ids=[45, 46],
+            poll_frequency_seconds=0.01,
+            initial_poll_seconds=0.01,
+        )
+
+        assert result == {
+            45: {"id": 45, "status": "completed"},
+            46: {"id": 46, "status": "completed"},
+        }
+
+    async def test_shared_client_closed(
+        self, mock_syncs, census_credentials, shared_clients
+    ):
+        mock_syncs(45, ["completed"])
+        mock_syncs(46, ["completed"])
+
+        await trigger_census_syncs_and_wait_for_completion(
+            credentials=census_credentials,
+            sync_ids=[45, 46],
+            poll_frequency_seconds=0.01,
+            initial_poll_seconds=0.01,
+        )
+
+        # The triggers and the status checks share one client
+        assert len(shared_clients) == 1
+        assert shared_clients[0].client.is_closed
+
+    async def test_run_failure(self, mock_syncs, census_credentials):
+        mock_syncs(45, ["working", "working", "completed"])
+        mock_syncs(46, ["working", "failed"])
+
+        with pytest.raises(CensusSyncRunFailed, match="1046"):
+            await trigger_census_syncs_and_wait_for_completion(
+                credentials=census_credentials,
+                sync_ids=[45, 46],
+                poll_frequency_seconds=0.01,
+                initial_poll_seconds=0.01,
             )
 
 
@@ -121,6 +418,32 @@ class TestRunCensusSync:
         assert result.final_status.value == "completed"
         assert result.run_data == {"id": 5, "status": "completed", "sync_run_id": 12345}
 
+    async def test_wait_survives_transient_errors(
+        self, respx_mock, census_credentials
+    ):
+        respx_mock.post(
+            "https://app.getcensus.com/api/v1/syncs/5/trigger",
+            headers={"Authorization": "Bearer my_api_key"},
+        ).mock(return_value=Response(200, json={"data": {"sync_run_id": 12345}}))
+        respx_mock.get(
+            "https://app.getcensus.com/api/v1/sync_runs/12345",
+            headers={"Authorization": "Bearer my_api_key"},
+        ).mock(
+            side_effect=[
+                Response(200, json={"data": {"id": 5, "status": "working"}}),
+                Response(503, json={"status": {"message": "unavailable"}}),
+                Response(200, json={"data": {"id": 5, "status": "completed"}}),
+            ]
+        )
+        census_sync = CensusSync(
+            credentials=census_credentials, sync_id=5, poll_frequency_seconds=0
+        )
+
+        census_sync_run = await census_sync.trigger()
+        await census_sync_run.wait_for_completion()
+
+        assert census_sync_run.status == "completed"
+
     def test_run_in_sync_flow(self, mock_successful_sync, census_sync):
         @flow
         def test_sync_flow():
@@ -131,6 +454,25 @@ class TestRunCensusSync:
         assert result.final_status.value == "completed"
         assert result.run_data == {"id": 5, "status": "completed", "sync_run_id": 12345}
 
+    def test_block_closes_its_clients(
+        self, mock_successful_sync, census_sync, monkeypatch
+    ):
+        clients = []
+        get_client = CensusCredentials.get_client
+
+        def recording_get_client(self):
+            client = get_client(self)
+            clients.append(client)
+            return client
+
+        monkeypatch.setattr(CensusCredentials, "get_client", recording_get_client)
+
+        for _ in range(3):
+            census_sync.trigger().wait_for_completion()
+
+        assert len(clients) == 6
+        assert all(client.client.is_closed for client in clients)
+
     async def test_run_success_with_wait(
         self, mock_successful_sync_with_wait, census_sync
     ):
@@ -157,6 +499,19 @@ class TestRunCensusSync:
             census_sync.poll_frequency_seconds = 2
             await run_census_sync(census_sync)
 
+    async def test_run_skipped(self, respx_mock, census_sync):
+        respx_mock.post(
+            "https://app.getcensus.com/api/v1/syncs/5/trigger",
+            headers={"Authorization": "Bearer my_api_key"},
+        ).mock(return_value=Response(200, json={"data": {"sync_run_id": 12345}}))
+        respx_mock.get(
+            "https://app.getcensus.com/api/v1/sync_runs/12345",
+            headers={"Authorization": "Bearer my_api_key"},
+        ).mock(return_value=Response(200, json={"data": {"status": "skipped"}}))
+
+        with pytest.raises(RuntimeError, match="unexpected status skipped$"):
+            await run_census_sync(census_sync)
+
     async def test_run_timed_out(self, mock_sync_timed_out, census_sync):
         with pytest.raises(CensusSyncRunTimeout):
             census_sync.poll_frequency_seconds = 2